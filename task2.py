@@ -8,15 +8,41 @@ Priority levels:
     1 - Highest priority (thesis/diploma projects)
     2 - Medium priority (lab work)
     3 - Lowest priority (personal projects)
+
+NumPy is optional: when it is installed and the volume limit never splits
+a batch, batch times are computed with vectorized segmented reductions.
+If Numba is installed as well, the general greedy packing loop runs as a
+compiled kernel over the same arrays.
 """
 
-from typing import List, Dict
+import math
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Dict, Tuple
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Queues shorter than this go straight to the scalar loop: building arrays
+# or slices costs more than the loop saves on small queues
+_VECTORIZE_MIN_JOBS = 100_000
+
+# Importing Numba and loading the packing kernel takes a few hundred ms,
+# about what the scalar loop needs for a million jobs
+_PACK_KERNEL_MIN_JOBS = 1_000_000
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PrintJob:
-    """Represents a 3D printing job."""
+    """
+    Represents a 3D printing job.
+
+    Documents the fields of a job dictionary; optimize_printing reads the
+    dictionaries directly instead of building a PrintJob per job.
+    """
     id: str
     volume: float
     priority: int
@@ -26,33 +52,92 @@ class PrintJob:
         return f"PrintJob({self.id}, vol={self.volume}, pri={self.priority}, time={self.print_time})"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PrinterConstraints:
     """Represents the constraints of the 3D printer."""
     max_volume: float
     max_items: int
 
 
-def optimize_printing(print_jobs: List[Dict], constraints: Dict) -> Dict:
+@lru_cache(maxsize=None)
+def _pack_kernel():
+    """
+    Import Numba and compile the greedy packing kernel on first use.
+
+    Numba is loaded only when the volume limit splits batches of a queue
+    of at least _PACK_KERNEL_MIN_JOBS jobs, so other calls never pay its
+    import and compile time.
+
+    Returns:
+        The compiled kernel, or None if Numba is not installed
+    """
+    try:
+        from numba import njit, types
+    except ImportError:
+        return None
+
+    @njit(
+        [
+            types.int64[::1](volume_type[::1], volume_type, types.int64)
+            for volume_type in (types.float64, types.int64)
+        ],
+        cache=True,
+    )
+    def kernel(volumes, max_volume, max_items):
+        """Greedy batch packing over a volume array; returns batch start indices."""
+        n = volumes.shape[0]
+        batch_starts = np.empty(n, np.int64)
+        batch_starts[0] = 0
+        count = 1
+        current_volume = 0
+        current_items = 0
+
+        for i in range(n):
+            if current_items and (not current_volume + volumes[i] <= max_volume or current_items >= max_items):
+                batch_starts[count] = i
+                count += 1
+                current_volume = 0
+                current_items = 0
+
+            current_volume += volumes[i]
+            current_items += 1
+
+        return batch_starts[:count]
+
+    return kernel
+
+
+def optimize_printing(print_jobs: List[Dict], constraints: Dict, first_fit_decreasing: bool = False) -> Dict:
     """
     Optimize the 3D printing queue based on priorities and printer constraints.
 
     The greedy algorithm:
-    1. Sort jobs by priority (highest first)
-    2. Within same priority, sort by volume (smaller first for better packing)
+    1. Sort jobs by priority (highest first) with a stable bucket pass,
+       since priorities only take the values 1, 2 and 3
+    2. Within same priority, keep the original submission order
     3. Group jobs into batches respecting max_volume and max_items constraints
     4. Calculate total time as sum of batch times (max time in each batch)
 
+    By default step 3 is Next-Fit: a batch is closed as soon as the next job
+    does not fit. With first_fit_decreasing=True, jobs of each priority are
+    taken from largest to smallest volume and placed into the first open
+    batch they fit, which usually needs fewer batches.
+
     Args:
         print_jobs: List of dictionaries with job information
                    Each dict contains: id, volume, priority, print_time
         constraints: Dictionary with max_volume and max_items
+        first_fit_decreasing: Use First-Fit-Decreasing packing within each
+                   priority instead of Next-Fit
 
     Returns:
         Dictionary with:
             - print_order: List of job IDs in execution order
             - total_time: Total time in minutes to complete all jobs
 
+    Raises:
+        ValueError: If a job has a priority other than 1, 2 or 3
+
     Examples:
         >>> jobs = [
         ...     {"id": "M1", "volume": 100, "priority": 1, "print_time": 120},
@@ -63,54 +148,225 @@ def optimize_printing(print_jobs: List[Dict], constraints: Dict) -> Dict:
         >>> result['print_order']
         ['M1', 'M2']
     """
-    jobs_with_index = [(i, PrintJob(**job)) for i, job in enumerate(print_jobs)]
     printer = PrinterConstraints(**constraints)
 
-    jobs_with_index.sort(key=lambda x: (x[1].priority, x[0]))
-    jobs = [job for _, job in jobs_with_index]
-
-    batches = []
-    current_batch = []
+    buckets = {1: [], 2: [], 3: []}
+    for job in print_jobs:
+        bucket = buckets.get(job["priority"])
+        if bucket is None:
+            raise ValueError(f"Unknown priority {job['priority']!r} for job {job['id']!r}")
+        bucket.append(job)
+
+    if first_fit_decreasing:
+        batch_jobs, batch_times = _first_fit_decreasing(list(buckets.values()), printer)
+        return {
+            "print_order": [job["id"] for batch in batch_jobs for job in batch],
+            "total_time": sum(batch_times)
+        }
+
+    jobs = [job for bucket in buckets.values() for job in bucket]
+    # Next-Fit never reorders jobs, so batches are consecutive runs of `jobs`
+    print_order = [job["id"] for job in jobs]
+
+    if len(jobs) >= _VECTORIZE_MIN_JOBS and printer.max_items >= 1:
+        if np is not None:
+            total_time = _vectorized_total_time(jobs, printer)
+        else:
+            total_time = _fixed_batches_total_time(jobs, printer)
+        if total_time is not None:
+            return {
+                "print_order": print_order,
+                "total_time": total_time
+            }
+
+    max_volume = printer.max_volume
+    max_items = printer.max_items
+    batch_times = []
+    current_items = 0
     current_volume = 0
     current_max_time = 0
 
     for job in jobs:
-        can_fit_volume = current_volume + job.volume <= printer.max_volume
-        can_fit_items = len(current_batch) < printer.max_items
-
-        if current_batch and (not can_fit_volume or not can_fit_items):
-            batches.append({
-                'jobs': current_batch,
-                'time': current_max_time
-            })
-            current_batch = []
+        volume = job["volume"]
+        print_time = job["print_time"]
+
+        if current_items and (not current_volume + volume <= max_volume or current_items >= max_items):
+            batch_times.append(current_max_time)
+            current_items = 0
             current_volume = 0
             current_max_time = 0
 
-        current_batch.append(job)
-        current_volume += job.volume
-        current_max_time = max(current_max_time, job.print_time)
-
-    if current_batch:
-        batches.append({
-            'jobs': current_batch,
-            'time': current_max_time
-        })
+        current_items += 1
+        current_volume += volume
+        if print_time > current_max_time:
+            current_max_time = print_time
 
-    print_order = []
-    total_time = 0
-
-    for batch in batches:
-        for job in batch['jobs']:
-            print_order.append(job.id)
-        total_time += batch['time']
+    if current_items:
+        batch_times.append(current_max_time)
 
     return {
         "print_order": print_order,
-        "total_time": total_time
+        "total_time": sum(batch_times)
     }
 
 
+def _first_fit_decreasing(jobs_by_priority: List[List[Dict]],
+                          printer: PrinterConstraints) -> Tuple[List[List[Dict]], List[int]]:
+    """
+    Pack jobs with First-Fit-Decreasing inside each priority level.
+
+    Open batches are the ones created for the current priority plus the
+    last batch of the previous priority, so a lower priority job never
+    prints ahead of a batch holding higher priority jobs.
+
+    Args:
+        jobs_by_priority: Job dictionaries grouped by priority, highest
+                   priority first
+        printer: Printer constraints
+
+    Returns:
+        Tuple of (jobs of each batch, time of each batch) in print order
+    """
+    batch_jobs = []
+    batch_times = []
+    batch_volumes = []
+
+    for jobs in jobs_by_priority:
+        first_open = max(len(batch_jobs) - 1, 0)
+
+        for job in sorted(jobs, key=lambda job: job["volume"], reverse=True):
+            for b in range(first_open, len(batch_jobs)):
+                if (batch_volumes[b] + job["volume"] <= printer.max_volume
+                        and len(batch_jobs[b]) < printer.max_items):
+                    batch_jobs[b].append(job)
+                    batch_volumes[b] += job["volume"]
+                    batch_times[b] = max(batch_times[b], job["print_time"])
+                    break
+            else:
+                batch_jobs.append([job])
+                batch_volumes.append(job["volume"])
+                batch_times.append(job["print_time"])
+
+    return batch_jobs, batch_times
+
+
+def _items_per_batch(max_items: float, job_count: int) -> int:
+    """
+    Whole number of jobs a batch may hold, capped at the number of jobs.
+
+    The greedy loop admits a job while len(batch) < max_items, which for a
+    fractional max_items is the same as len(batch) < ceil(max_items).
+    """
+    return job_count if max_items >= job_count else math.ceil(max_items)
+
+
+def _fixed_batches_total_time(jobs: List[Dict], printer: PrinterConstraints) -> int | None:
+    """
+    Compute the total time without the per-job loop when volume is slack.
+
+    If every run of max_items consecutive jobs fits within max_volume, the
+    greedy loop would produce exactly those runs, so each batch time is a
+    max() over a slice of print times. Runs are checked with running totals
+    from accumulate(), which adds volumes in the same left-to-right order
+    as the loop, so float volumes give the same result.
+
+    Args:
+        jobs: Non-empty list of job dictionaries in print order
+        printer: Printer constraints with max_items of at least 1
+
+    Returns:
+        Total time in minutes, or None if the volume limit would split a batch
+    """
+    size = _items_per_batch(printer.max_items, len(jobs))
+    volumes = [job["volume"] for job in jobs]
+    for i in range(0, len(volumes), size):
+        if not all(total <= printer.max_volume for total in accumulate(volumes[i:i + size])):
+            return None
+
+    times = [job["print_time"] for job in jobs]
+    return sum(max(times[i:i + size]) for i in range(0, len(times), size))
+
+
+def _vectorized_total_time(jobs: List[Dict], printer: PrinterConstraints) -> int | None:
+    """
+    Compute the total time of the greedy batching over NumPy arrays.
+
+    Jobs are laid out as separate volume and time arrays. If every run of
+    max_items consecutive jobs fits within max_volume, the greedy loop
+    would produce exactly those runs, so batch times are one segmented
+    maximum over the time array. Float volumes are checked with running
+    totals in the loop's left-to-right order, since a float sum depends on
+    the order of additions. Otherwise the compiled packing kernel
+    finds the batch boundaries when Numba is available, and batch times
+    are the same segmented maximum over those boundaries.
+
+    Only plain int and float volumes below 2**53 in magnitude are handled,
+    since float64 holds every such integer exactly; anything else (Decimal
+    volumes, larger values, inf) is left to the exact Python loop. When
+    max_volume and every volume are whole numbers, volumes are kept as
+    int64 so capacity checks are exact integer comparisons.
+
+    Args:
+        jobs: Non-empty list of job dictionaries in print order
+        printer: Printer constraints with max_items of at least 1
+
+    Returns:
+        Total time in minutes, or None if some print time is not an int
+        (so that float times keep the loop's float result), if the times
+        could overflow an int64 total, if the volumes cannot be represented
+        exactly as described above, or if the volume limit would split a
+        batch and the queue is too short for the kernel or Numba is not
+        available
+    """
+    times = np.array([job["print_time"] for job in jobs])
+    if times.dtype != np.int64 or max(-int(times.min()), int(times.max())) * len(jobs) >= 2 ** 63:
+        return None
+
+    max_volume = printer.max_volume
+    if not isinstance(max_volume, (int, float)) or abs(max_volume) >= 2 ** 53:
+        return None
+
+    volumes = np.array([job["volume"] for job in jobs])
+    if volumes.dtype not in (np.int64, np.float64):
+        return None
+    max_abs_volume = max(abs(float(volumes.min())), abs(float(volumes.max())))
+    if max_abs_volume >= 2 ** 53:
+        return None
+
+    max_items = _items_per_batch(printer.max_items, len(jobs))
+    whole = float(max_volume).is_integer() and (volumes == np.floor(volumes)).all()
+
+    if whole and int(max_abs_volume) * max_items < 2 ** 63:
+        volumes = volumes.astype(np.int64)
+        max_volume = int(max_volume)
+    elif volumes.dtype == np.int64:
+        return None
+    else:
+        max_volume = float(max_volume)
+
+    batch_starts = np.arange(0, len(jobs), max_items)
+
+    if volumes.dtype == np.int64:
+        fits = (np.add.reduceat(volumes, batch_starts) <= max_volume).all()
+    else:
+        runs = np.zeros(len(batch_starts) * max_items)
+        runs[:len(jobs)] = volumes
+        fits = (np.cumsum(runs.reshape(-1, max_items), axis=1) <= max_volume).all()
+
+    if fits:
+        return int(np.maximum.reduceat(times, batch_starts).sum())
+
+    if len(jobs) < _PACK_KERNEL_MIN_JOBS:
+        return None
+
+    kernel = _pack_kernel()
+    if kernel is None:
+        return None
+
+    batch_starts = kernel(volumes, max_volume, max_items)
+    return int(np.maximum.reduceat(times, batch_starts).sum())
+
+
 def test_printing_optimization():
     """Test the printing optimization with various scenarios."""
 
@@ -230,6 +486,61 @@ def test_printing_optimization():
     print(f"           Time = 80 minutes")
     print(f"  Total: 70 + 80 = 150 minutes")
 
+    print("\n" + "=" * 60)
+    print("Test 6: First-Fit-Decreasing packing")
+    print("=" * 60)
+    test6_jobs = [
+        {"id": "M1", "volume": 150, "priority": 1, "print_time": 60},
+        {"id": "M2", "volume": 200, "priority": 1, "print_time": 90},
+        {"id": "M3", "volume": 100, "priority": 1, "print_time": 80},
+        {"id": "M4", "volume": 50, "priority": 1, "print_time": 40}
+    ]
+
+    result6_next_fit = optimize_printing(test6_jobs, constraints)
+    result6 = optimize_printing(test6_jobs, constraints, first_fit_decreasing=True)
+    print(f"Jobs: {test6_jobs}")
+    print(f"Constraints: max_volume={constraints['max_volume']}, max_items={constraints['max_items']}")
+    print(f"\nResult (Next-Fit):")
+    print(f"  Print order: {result6_next_fit['print_order']}")
+    print(f"  Total time: {result6_next_fit['total_time']} minutes")
+    print(f"\nResult (First-Fit-Decreasing):")
+    print(f"  Print order: {result6['print_order']}")
+    print(f"  Total time: {result6['total_time']} minutes")
+    print(f"\nExplanation:")
+    print(f"  Next-Fit: [M1], [M2, M3], [M4] = 60 + 90 + 40 = 190 minutes")
+    print(f"  By volume: M2 (200), M1 (150), M3 (100), M4 (50)")
+    print(f"  Batch 1: M2 (vol=200) + M3 (vol=100) = 300 <= 300")
+    print(f"           Time = max(90, 80) = 90 minutes")
+    print(f"  Batch 2: M1 (vol=150) + M4 (vol=50) = 200 <= 300")
+    print(f"           Time = max(60, 40) = 60 minutes")
+    print(f"  Total: 90 + 60 = 150 minutes")
+
+    print("\n" + "=" * 60)
+    print("Test 7: Fractional volumes at the volume limit")
+    print("=" * 60)
+    test7_jobs = [
+        {"id": "M1", "volume": 0.1, "priority": 1, "print_time": 1},
+        {"id": "M2", "volume": 0.2, "priority": 1, "print_time": 2},
+        {"id": "M3", "volume": 0.3, "priority": 1, "print_time": 3}
+    ]
+    test7_constraints = {
+        "max_volume": 0.6,
+        "max_items": 3
+    }
+
+    result7 = optimize_printing(test7_jobs, test7_constraints)
+    print(f"Jobs: {test7_jobs}")
+    print(f"Constraints: max_volume={test7_constraints['max_volume']}, max_items={test7_constraints['max_items']}")
+    print(f"\nResult:")
+    print(f"  Print order: {result7['print_order']}")
+    print(f"  Total time: {result7['total_time']} minutes")
+    print(f"\nExplanation:")
+    print(f"  Running volume: 0.1 + 0.2 = {0.1 + 0.2} <= 0.6")
+    print(f"                  {0.1 + 0.2} + 0.3 = {0.1 + 0.2 + 0.3} > 0.6")
+    print(f"  Batch 1: M1 + M2, Time = max(1, 2) = 2 minutes")
+    print(f"  Batch 2: M3, Time = 3 minutes")
+    print(f"  Total: 2 + 3 = 5 minutes")
+
 
 if __name__ == "__main__":
     test_printing_optimization()